@@ -1,52 +1,103 @@
 import logging
 import time
-import threading
 import os
-import json
+import queue
+import atexit
+import asyncio
+import heapq
+import itertools
+import contextlib
+from concurrent.futures import ThreadPoolExecutor
 from datetime import timedelta
-from logging.handlers import RotatingFileHandler
+from pathlib import Path
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 
 import discord
 from discord import app_commands
 from discord.ext import commands
+import orjson
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
 
 TOKEN = os.environ.get('DISCORD_BOT_TOKEN')
+BASE_DIR = Path(__file__).parent
 BAD_BOT_ROLE_NAME = 'bad bots'
 MODERATOR_ROLE_NAME = 'Moderators'
 AUTOMATA_ROLE_NAME = 'automata'
 DELAY_MINUTES = 4
-LOG_FILE = os.path.join(os.path.dirname(__file__), 'johnnybot.log')
+LOG_FILE = BASE_DIR / 'johnnybot.log'
 LOG_MAX_SIZE = 5 * 1024 * 1024  # 5MB
+LOG_TAIL_BLOCK_SIZE = 8192
 MODERATORS_CHANNEL_NAME = 'moderators_only'
-PROTECTED_CHANNELS = ['🫠・code_of_conduct', '🧚・hey_listen', '👯・local_events']
-REMINDERS_FILE = os.path.join(os.path.dirname(__file__), 'reminders.json')
+PROTECTED_CHANNELS = frozenset({'🫠・code_of_conduct', '🧚・hey_listen', '👯・local_events'})
+REMINDERS_FILE = BASE_DIR / 'reminders.json'
+REMINDER_KEYS = frozenset(('channel_id', 'title', 'message', 'interval'))  # Fields every saved reminder must have
+REMINDERS_LOCK_FILE = BASE_DIR / 'reminders.json.lock'
+REMINDERS_FLUSH_SECONDS = 1  # Debounce window for coalescing reminders.json writes
+PURGE_MAX_LIMIT = 1000
+IO_MAX_WORKERS = 4
+MIN_REMINDER_INTERVAL = 30  # Seconds; shorter intervals just spam the channel into rate limits
 
-# Configure logging
+# Configure logging; records are queued and written to disk by a background thread
 logger = logging.getLogger('discord')
 logger.setLevel(logging.INFO)
-handler = RotatingFileHandler(LOG_FILE, maxBytes=LOG_MAX_SIZE, backupCount=2)
-formatter = logging.Formatter('%(asctime)s %(levelname)s %(name)s: %message)s')
+logger.propagate = False
+handler = RotatingFileHandler(LOG_FILE, maxBytes=LOG_MAX_SIZE, backupCount=2, encoding='utf-8')
+formatter = logging.Formatter('%(asctime)s %(levelname)s %(name)s: %(message)s')
 handler.setFormatter(formatter)
-logger.addHandler(handler)
+log_queue = queue.SimpleQueue()
+logger.addHandler(QueueHandler(log_queue))
+log_listener = QueueListener(log_queue, handler, respect_handler_level=True)
+log_listener.start()
+atexit.register(log_listener.stop)
 
-intents = discord.Intents.default()
-intents.message_content = True
+# Only subscribe to the gateway events the bot uses; typing, presence and voice
+# updates would otherwise be parsed and dispatched for nothing
+intents = discord.Intents.none()
 intents.guilds = True
 intents.members = True
+intents.guild_messages = True
+intents.dm_messages = True
+intents.message_content = True
 
-bot = commands.Bot(command_prefix='!', intents=intents)
+# Reminder and /botsay text is moderator-supplied; never let it ping @everyone, roles or users
+bot = commands.Bot(command_prefix='!', intents=intents, chunk_guilds_at_startup=False, allowed_mentions=discord.AllowedMentions.none())
 tree = bot.tree
 
 reminders = {}
-reminder_threads = {}
+reminder_titles = {}  # Title -> channel id index used by delete_reminder
+reminder_queue = []  # Heap of (send_time, sequence, reminder, content) ordered by loop.time() deadline
+reminder_sequence = itertools.count()  # Tie-breaker so heap entries never compare reminder dicts
+reminder_wakeup = None  # asyncio.Event set when reminder_queue gains an earlier deadline
+reminder_task = None
+reminder_flush_task = None
+reminders_dirty = False  # Set on every change; reminder_flush_loop writes REMINDERS_FILE
+reminders_changed = None  # asyncio.Event that wakes reminder_flush_loop
+reminder_list_cache = None  # Rendered /list_reminders body, reset whenever reminders change
+moderator_role_ids = {}  # Guild id -> id of its MODERATOR_ROLE_NAME role, filled on first use
 
-# Load reminders from file
-if os.path.exists(REMINDERS_FILE):
-    try:
-        with open(REMINDERS_FILE, 'r', encoding='utf-8') as f:
-            reminders = json.load(f)
-    except (OSError, IOError) as e:
-        logger.error('Failed to read reminders file: %s', e)
+@bot.event
+async def setup_hook():
+    global reminder_task, reminder_flush_task, reminder_wakeup, reminders_changed
+    # asyncio.to_thread runs on the default executor; keep it small since it only does file I/O
+    asyncio.get_running_loop().set_default_executor(ThreadPoolExecutor(max_workers=IO_MAX_WORKERS, thread_name_prefix='johnnybot-io'))
+
+    # Runs once, before the gateway connects, so no command can see reminders before they are loaded
+    reminder_wakeup = asyncio.Event()
+    reminders_changed = asyncio.Event()
+    reminder_task = asyncio.create_task(reminder_loop())
+    reminder_flush_task = asyncio.create_task(reminder_flush_loop())
+    await load_reminders()
+    for reminder in reminders.values():
+        schedule_reminder(reminder)
 
 @bot.event
 async def on_ready():
@@ -56,114 +107,267 @@ async def on_ready():
     except (discord.HTTPException, discord.Forbidden) as e:
         logger.error('Failed to sync commands globally: %s', e)
 
-    for guild in bot.guilds:
-        try:
-            await tree.sync(guild=guild)
-            logger.info('Successfully synced commands to guild: %s', guild.id)
-        except (discord.HTTPException, discord.Forbidden, discord.NotFound) as e:
-            logger.error('Failed to sync commands to guild %s: %s', guild.id, e)
-    logger.info('All commands synced to joined guilds')
     logger.info('Logged in as %s (ID: %s)', bot.user, bot.user.id)
     print(f'Logged in as {bot.user} (ID: {bot.user.id})')
     print('------')
 
-    # Restart reminder loops for existing reminders
+@contextlib.contextmanager
+def reminders_file_lock(exclusive):
+    """Holds an advisory lock so two bot processes never interleave reminders.json reads and writes."""
+    if fcntl is None:
+        yield
+        return
+    with open(REMINDERS_LOCK_FILE, 'a') as lock_file:
+        fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+        yield  # Closing lock_file releases the lock
+
+def read_reminders():
+    """Reads saved reminders from REMINDERS_FILE."""
+    with reminders_file_lock(exclusive=False), open(REMINDERS_FILE, 'rb') as reminder_file:
+        data = orjson.loads(reminder_file.read())
+    try:
+        # JSON object keys are strings; key by the integer channel id like set_reminder does
+        saved = {int(channel_id): reminder for channel_id, reminder in data.items()}
+        for reminder in saved.values():
+            missing = REMINDER_KEYS.difference(reminder)
+            if missing:
+                raise ValueError(f'reminder is missing {", ".join(sorted(missing))}')
+            # bool is an int subclass but never a valid id or interval
+            if not isinstance(reminder['channel_id'], int) or isinstance(reminder['channel_id'], bool):
+                raise ValueError(f"channel_id {reminder['channel_id']!r} is not an integer")
+            if not isinstance(reminder['interval'], (int, float)) or isinstance(reminder['interval'], bool):
+                raise ValueError(f"interval {reminder['interval']!r} is not a number")
+            if not isinstance(reminder['title'], str) or not isinstance(reminder['message'], str):
+                raise ValueError(f"title and message of reminder in channel {reminder['channel_id']} must be strings")
+    except (AttributeError, TypeError) as e:
+        raise ValueError(f'unexpected reminder layout: {e}') from e
+    return saved
+
+def move_corrupt_reminders():
+    """Moves an unreadable REMINDERS_FILE aside so the next save cannot overwrite it."""
+    corrupt_file = REMINDERS_FILE.with_name(REMINDERS_FILE.name + '.corrupt')
+    with reminders_file_lock(exclusive=True):
+        os.replace(REMINDERS_FILE, corrupt_file)
+    return corrupt_file
+
+def write_reminders(data):
+    """Writes reminders to REMINDERS_FILE, replacing it atomically."""
+    temp_file = REMINDERS_FILE.with_name(REMINDERS_FILE.name + '.tmp')
+    with reminders_file_lock(exclusive=True):
+        with open(temp_file, 'wb') as reminder_file:
+            reminder_file.write(orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS))
+        os.replace(temp_file, REMINDERS_FILE)
+
+async def load_reminders():
+    """Loads saved reminders and indexes them by title."""
+    if REMINDERS_FILE.exists():
+        try:
+            reminders.update(await asyncio.to_thread(read_reminders))
+        except (OSError, IOError) as e:
+            logger.error('Failed to read reminders file: %s', e)
+        except ValueError as e:
+            # Covers orjson.JSONDecodeError too; keep the data for recovery instead of saving over it
+            corrupt_file = await asyncio.to_thread(move_corrupt_reminders)
+            logger.error('Reminders file is corrupt (%s); moved it to %s', e, corrupt_file)
     for reminder in reminders.values():
-        stop_event = threading.Event()
-        reminder_thread = threading.Thread(target=send_reminder, args=(reminder['channel_id'], reminder['title'], reminder['message'], reminder['interval'], stop_event))
-        reminder_thread.daemon = True
-        reminder_thread.start()
-        reminder_threads[reminder['channel_id']] = stop_event
-
-def send_reminder(channel_id, title, message, interval, stop_event):
-    """Sends a reminder message to a channel at regular intervals."""
-    channel = bot.get_channel(channel_id)
-    if channel:
-        bot.loop.create_task(channel.send(f'**{title}**\n{message}'))
-    while not stop_event.is_set():
-        stop_event.wait(interval)
-        if stop_event.is_set():
-            break
-        if channel:
-            bot.loop.create_task(channel.send(f'**{title}**\n{message}'))
+        if reminder['interval'] < MIN_REMINDER_INTERVAL:
+            # Older versions accepted any interval; zero or less would keep the reminder due forever
+            logger.warning('Raised interval of reminder "%s" in channel %s from %s to %s seconds', reminder['title'], reminder['channel_id'], reminder['interval'], MIN_REMINDER_INTERVAL)
+            reminder['interval'] = MIN_REMINDER_INTERVAL
+            mark_reminders_dirty()
+        title = reminder['title']
+        # Older versions allowed one title in several channels; rename repeats so each stays deletable
+        while title in reminder_titles:
+            title = f"{title} ({reminder['channel_id']})"
+        if title != reminder['title']:
+            logger.warning('Renamed duplicate reminder "%s" in channel %s to "%s"', reminder['title'], reminder['channel_id'], title)
+            reminder['title'] = title
+            mark_reminders_dirty()
+        reminder_titles[title] = reminder['channel_id']
+
+def mark_reminders_dirty():
+    """Flags reminders for the next flush and drops the cached /list_reminders output."""
+    global reminders_dirty, reminder_list_cache
+    reminders_dirty = True
+    reminder_list_cache = None
+    reminders_changed.set()
+
+async def reminder_flush_loop():
+    """Writes reminders to disk REMINDERS_FLUSH_SECONDS after a change, coalescing bursts."""
+    global reminders_dirty
+    while True:
+        await reminders_changed.wait()
+        await asyncio.sleep(REMINDERS_FLUSH_SECONDS)
+        reminders_changed.clear()
+        reminders_dirty = False
+        try:
+            await asyncio.to_thread(write_reminders, dict(reminders))
+        except (OSError, IOError) as e:
+            reminders_dirty = True
+            reminders_changed.set()  # Retry after the next debounce window
+            logger.error('Failed to write reminders file: %s', e)
+
+@atexit.register
+def flush_reminders():
+    """Writes any reminder changes still pending at shutdown."""
+    if reminders_dirty:
+        try:
+            write_reminders(reminders)
+        except (OSError, IOError) as e:
+            logger.error('Failed to write reminders file: %s', e)
+
+def schedule_reminder(reminder, delay=0, content=None):
+    """Queues a reminder to be sent after delay seconds."""
+    if content is None:
+        content = f"**{reminder['title']}**\n{reminder['message']}"
+    deadline = asyncio.get_running_loop().time() + delay
+    heapq.heappush(reminder_queue, (deadline, next(reminder_sequence), reminder, content))
+    reminder_wakeup.set()
+
+async def send_reminder(reminder, content):
+    """Sends a reminder message to its channel."""
+    channel = bot.get_channel(reminder['channel_id'])
+    if not channel:
+        return
+    if not channel.permissions_for(channel.guild.me).send_messages:
+        logger.warning('Skipping reminder for channel %s: missing Send Messages permission', channel.id)
+        return
+    try:
+        await channel.send(content)
+    except discord.HTTPException as e:
+        logger.error('Failed to send reminder to channel %s: %s', reminder['channel_id'], e)
+
+async def reminder_loop():
+    """Sends every reminder at its interval, sleeping until the earliest one is due."""
+    await bot.wait_until_ready()  # Channels are only cached once the gateway is ready
+    loop = asyncio.get_running_loop()
+    while True:
+        delay = reminder_queue[0][0] - loop.time() if reminder_queue else None
+        if delay is None or delay > 0:
+            reminder_wakeup.clear()
+            try:
+                await asyncio.wait_for(reminder_wakeup.wait(), delay)
+            except asyncio.TimeoutError:
+                pass
+            continue
+
+        _, _, reminder, content = heapq.heappop(reminder_queue)
+        if reminders.get(reminder['channel_id']) is not reminder:
+            continue  # Deleted or replaced since it was queued
+        try:
+            schedule_reminder(reminder, max(reminder['interval'], MIN_REMINDER_INTERVAL), content)
+            await send_reminder(reminder, content)
+        except Exception as e:  # One bad reminder must not stop every other one
+            logger.error('Failed to process reminder for channel %s: %s', reminder['channel_id'], e, exc_info=e)
+
+@bot.event
+async def on_guild_role_update(before, after):
+    if before.name != after.name:
+        moderator_role_ids.pop(after.guild.id, None)
+
+@bot.event
+async def on_guild_role_delete(role):
+    if moderator_role_ids.get(role.guild.id) == role.id:
+        del moderator_role_ids[role.guild.id]
+
+@tree.error
+async def on_app_command_error(interaction: discord.Interaction, error: app_commands.AppCommandError):
+    """Reports a failed slash command back to the user who ran it."""
+    if not isinstance(error, app_commands.CheckFailure):
+        command_name = interaction.command.name if interaction.command else None
+        logger.error('Command %s failed: %s', command_name, error, exc_info=error)
+    if interaction.response.is_done():
+        await interaction.followup.send(f'Error: {error}', ephemeral=True)
+    else:
+        await interaction.response.send_message(f'Error: {error}', ephemeral=True)
+
+def is_moderator():
+    """Like app_commands.checks.has_role(MODERATOR_ROLE_NAME), but tries a cached role id first."""
+    def predicate(interaction: discord.Interaction) -> bool:
+        if isinstance(interaction.user, discord.User):
+            raise app_commands.NoPrivateMessage()
+
+        guild_id = interaction.guild.id
+        role_id = moderator_role_ids.get(guild_id)
+        if role_id is None:
+            role = discord.utils.get(interaction.guild.roles, name=MODERATOR_ROLE_NAME)
+            if role is not None:
+                role_id = moderator_role_ids[guild_id] = role.id
+        if role_id is not None and interaction.user.get_role(role_id) is not None:
+            return True
+        # has_role accepts any role with that name, and a guild may have more than one
+        if discord.utils.get(interaction.user.roles, name=MODERATOR_ROLE_NAME) is None:
+            raise app_commands.MissingRole(MODERATOR_ROLE_NAME)
+        return True
+    return app_commands.check(predicate)
 
 @tree.command(name='set_reminder', description='Sets a reminder message to be sent to a channel at regular intervals')
-@app_commands.describe(channel='Channel to send the reminder to', title='Title of the reminder', message='Reminder message', interval='Interval in seconds')
-@app_commands.checks.has_role(MODERATOR_ROLE_NAME)
-async def set_reminder(interaction: discord.Interaction, channel: discord.TextChannel, title: str, message: str, interval: int):
+@app_commands.describe(channel='Channel to send the reminder to', title='Title of the reminder', message='Reminder message', interval=f'Interval in seconds (at least {MIN_REMINDER_INTERVAL})')
+@is_moderator()
+async def set_reminder(interaction: discord.Interaction, channel: discord.TextChannel, title: str, message: str, interval: app_commands.Range[int, MIN_REMINDER_INTERVAL]):
     """Sets a reminder message to be sent to a channel at regular intervals."""
+    if interval < MIN_REMINDER_INTERVAL:
+        await interaction.response.send_message(f'Interval must be at least {MIN_REMINDER_INTERVAL} seconds.', ephemeral=True)
+        return
+
+    existing_channel_id = reminder_titles.get(title)
+    if existing_channel_id is not None and existing_channel_id != channel.id:
+        await interaction.response.send_message(f'A reminder titled "{title}" already exists in <#{existing_channel_id}>.', ephemeral=True)
+        return
+
+    previous = reminders.get(channel.id)
+    if previous is not None:
+        reminder_titles.pop(previous['title'], None)
+    reminder_titles[title] = channel.id
     reminders[channel.id] = {
         'channel_id': channel.id,
         'title': title,
         'message': message,
         'interval': interval
     }
-    try:
-        with open(REMINDERS_FILE, 'w', encoding='utf-8') as reminder_file:
-            json.dump(reminders, reminder_file)
-    except (OSError, IOError) as e:
-        logger.error('Failed to write reminders file: %s', e)
-        await interaction.response.send_message('Failed to set reminder due to file access error.', ephemeral=True)
-        return
-    
-    # Start the reminder loop using threading.Timer
-    stop_event = threading.Event()
-    reminder_thread = threading.Thread(target=send_reminder, args=(channel.id, title, message, interval, stop_event))
-    reminder_thread.daemon = True
-    reminder_thread.start()
-    reminder_threads[channel.id] = stop_event
-    
+    mark_reminders_dirty()
+    schedule_reminder(reminders[channel.id])
     await interaction.response.send_message(f'Reminder set in {channel.mention} every {interval} seconds.', ephemeral=True)
 
-@set_reminder.error
-async def set_reminder_error(interaction: discord.Interaction, error):
-    """Handles errors for the set_reminder command."""
-    await interaction.response.send_message(f'Error: {error}', ephemeral=True)
-
 @tree.command(name='list_reminders', description='Lists all current reminders')
 async def list_reminders(interaction: discord.Interaction):
     """Lists all current reminders."""
+    global reminder_list_cache
     if not reminders:
         await interaction.response.send_message('There are no reminders set.', ephemeral=True)
         return
 
-    reminder_list = '\n'.join([f"**{reminder['title']}**: {reminder['message']} (every {reminder['interval']} seconds)" for reminder in reminders.values()])
-    await interaction.response.send_message(f'Current reminders:\n{reminder_list}', ephemeral=True)
+    if reminder_list_cache is None:
+        reminder_list_cache = '\n'.join(f"**{reminder['title']}**: {reminder['message']} (every {reminder['interval']} seconds)" for reminder in reminders.values())
+    await interaction.response.send_message(f'Current reminders:\n{reminder_list_cache}', ephemeral=True)
 
 @tree.command(name='delete_reminder', description='Deletes a reminder by title')
 @app_commands.describe(title='Title of the reminder to delete')
-@app_commands.checks.has_role(MODERATOR_ROLE_NAME)
+@is_moderator()
 async def delete_reminder(interaction: discord.Interaction, title: str):
-    for channel_id, reminder in reminders.items():
-        if reminder['title'] == title:
-            del reminders[channel_id]
-            if channel_id in reminder_threads:
-                reminder_threads[channel_id].set()  # Stop the reminder thread
-                del reminder_threads[channel_id]
-            try:
-                with open(REMINDERS_FILE, 'w', encoding='utf-8') as reminder_file:
-                    json.dump(reminders, reminder_file)
-            except (OSError, IOError) as e:
-                logger.error('Failed to write reminders file: %s', e)
-                await interaction.response.send_message('Failed to delete reminder due to file access error.', ephemeral=True)
-                return
-            await interaction.response.send_message(f'Reminder titled "{title}" has been deleted.', ephemeral=True)
-            return
+    channel_id = reminder_titles.pop(title, None)
+    if channel_id is None:
+        await interaction.response.send_message(f'No reminder found with the title "{title}".', ephemeral=True)
+        return
 
-    await interaction.response.send_message(f'No reminder found with the title "{title}".', ephemeral=True)
+    del reminders[channel_id]  # reminder_loop skips its queued send
+    mark_reminders_dirty()
+    await interaction.response.send_message(f'Reminder titled "{title}" has been deleted.', ephemeral=True)
 
 # Purge channel messages
 @tree.command(name='purge', description='Purges a specified number of messages from a channel')
-@app_commands.describe(channel='Channel to purge messages from', limit='Number of messages to delete')
-@app_commands.describe(limit='Number of messages to delete')
+@app_commands.describe(channel='Channel to purge messages from', limit=f'Number of messages to delete (at most {PURGE_MAX_LIMIT})')
 async def purge(interaction: discord.Interaction, channel: discord.TextChannel, limit: int):
-    deleted = await channel.purge(limit=limit)
-    await interaction.response.send_message(f'Deleted {len(deleted)} message(s)', ephemeral=True)
+    limit = min(limit, PURGE_MAX_LIMIT)
+    # Large purges outlast the 3 second interaction window; acknowledge first and report afterwards
+    await interaction.response.defer(ephemeral=True)
+    deleted = await channel.purge(limit=limit, bulk=True, oldest_first=False, reason=f'Purged by {interaction.user}')
+    await interaction.followup.send(f'Deleted {len(deleted)} message(s)', ephemeral=True)
 
 # Kick a member
 @tree.command(name='kick', description='Kicks a member from the server')
 @app_commands.describe(member='Member to kick', reason='Reason for kick')
-@app_commands.checks.has_role(MODERATOR_ROLE_NAME)
+@is_moderator()
 async def kick(interaction: discord.Interaction, member: discord.Member, reason: str = None):
     await member.kick(reason=reason)
     await interaction.response.send_message(f'{member.mention} has been kicked. Reason: {reason}', ephemeral=True)
@@ -171,7 +375,7 @@ async def kick(interaction: discord.Interaction, member: discord.Member, reason:
 # Make the bot say something in chat
 @tree.command(name='botsay', description='Makes the bot send a message to a specified channel')
 @app_commands.describe(channel='Channel to send the message to', message='Message to send')
-@app_commands.checks.has_role(MODERATOR_ROLE_NAME)
+@is_moderator()
 async def botsay(interaction: discord.Interaction, channel: discord.TextChannel, message: str):
     await channel.send(message)
     await interaction.response.send_message(f'Message sent to {channel.mention}', ephemeral=True)
@@ -179,18 +383,36 @@ async def botsay(interaction: discord.Interaction, channel: discord.TextChannel,
 # Put a member in time out
 @tree.command(name='timeout', description='Timeouts a member for a specified duration')
 @app_commands.describe(member='Member to timeout', duration='Timeout duration in seconds', reason='Reason for timeout')
-@app_commands.checks.has_role(MODERATOR_ROLE_NAME)
+@is_moderator()
 async def timeout(interaction: discord.Interaction, member: discord.Member, duration: int, reason: str = None):
     until = discord.utils.utcnow() + timedelta(seconds=duration)
     await member.timeout(until, reason=reason)
     await interaction.response.send_message(f'{member.mention} has been timed out for {duration} seconds.', ephemeral=True)
 
+def read_log_tail(path, lines):
+    """Returns the last lines of a log file, reading backwards from the end in blocks."""
+    if lines <= 0:
+        return ''
+    blocks = []
+    newlines = 0
+    with open(path, 'rb') as log_file:
+        position = log_file.seek(0, os.SEEK_END)
+        # Stop after one newline more than requested so the oldest wanted line is complete
+        while position > 0 and newlines <= lines:
+            read_size = min(LOG_TAIL_BLOCK_SIZE, position)
+            position -= read_size
+            log_file.seek(position)
+            block = log_file.read(read_size)
+            blocks.append(block)
+            newlines += block.count(b'\n')
+    tail = b''.join(reversed(blocks)).splitlines(keepends=True)[-lines:]
+    return b''.join(tail).decode('utf-8', errors='replace')
+
 @tree.command(name='log_tail', description='DM the last specified number of lines of the bot log to the user')
 @app_commands.describe(lines='Number of lines to retrieve from the log')
 async def log_tail(interaction: discord.Interaction, lines: int):
     try:
-        with open(LOG_FILE, 'r', encoding='utf-8') as log_file:
-            last_lines = ''.join(log_file.readlines()[-lines:])
+        last_lines = await asyncio.to_thread(read_log_tail, LOG_FILE, lines)
         if last_lines:
             await interaction.user.send(f'```{last_lines}```')
             await interaction.response.send_message('Log lines sent to your DMs.', ephemeral=True)
@@ -200,4 +422,9 @@ async def log_tail(interaction: discord.Interaction, lines: int):
         logger.error('Failed to read log file: %s', e)
         await interaction.response.send_message('Failed to retrieve log file.', ephemeral=True)
 
-bot.run(TOKEN)
\ No newline at end of file
+if __name__ == '__main__':
+    if uvloop is not None:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+    # Logging is already routed to the rotating file; don't let discord.py add a stderr handler
+    bot.run(TOKEN, log_handler=None)